@@ -3,13 +3,20 @@
 Factotum Agent - An interactive chat with a sandboxed AI agent that can think, execute code,
 browse the web, read / edit files, and solve complex tasks.
 
-- Put files in `input/` folder - they're uploaded to the agent's context before each run
+- Put files in `input/` folder - new or changed ones are uploaded to the agent's context before each run
 - Files the agent creates are automatically downloaded to your `output/` folder
+  (bundled into one `.tar` when a run produces many)
 
 Run: python factotum.py
 """
 import asyncio
+import io
 import os
+import sys
+import tarfile
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 from swarmkit import SwarmKit, AgentConfig, E2BProvider
@@ -18,6 +25,11 @@ from rich.panel import Panel
 
 load_dotenv()  # Load .env file
 
+try:
+    import uvloop                               # optional: faster event loop (not on Windows)
+except ImportError:
+    uvloop = None
+
 # ─────────────────────────────────────────────────────────────
 # SwarmKit Instance Configuration
 # ─────────────────────────────────────────────────────────────
@@ -38,6 +50,7 @@ MCP_SERVERS = {}
 MCP_SERVERS["chrome-devtools"] = {
     "command": "npx",
     "args": [
+        "--prefer-offline",                     # reuse npx cache, skip registry check
         "chrome-devtools-mcp@latest",
         "--headless=true",
         "--isolated=true",
@@ -51,7 +64,7 @@ MCP_SERVERS["chrome-devtools"] = {
 if os.getenv("EXA_API_KEY"):                    # optional: web search
     MCP_SERVERS["exa"] = {
         "command": "npx",
-        "args": ["-y", "mcp-remote", "https://mcp.exa.ai/mcp"],
+        "args": ["-y", "--prefer-offline", "mcp-remote", "https://mcp.exa.ai/mcp"],
         "env": {"EXA_API_KEY": os.getenv("EXA_API_KEY")}
     }
 
@@ -73,8 +86,114 @@ agent = SwarmKit(
 
 # ─────────────────────────────────────────────────────────────
 
+class InputSync:
+    """Uploads `input/` files to the agent's context, skipping ones the sandbox already has."""
+
+    def __init__(self, directory: str = "input"):
+        self.directory = directory
+        self._uploaded: dict[str, tuple[int, int]] = {}  # name -> (st_mtime_ns, st_size)
+        self._session = None  # Sandbox that received the files in _uploaded
+
+    def invalidate(self):
+        """Forget what was uploaded so the next sync re-sends every file."""
+        self._uploaded.clear()
+
+    def _scan(self) -> dict:
+        """Return {name: (path, identity)} for every file in the directory."""
+        # is_file() uses the readdir file type; stat() is cached per DirEntry
+        files = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    st = entry.stat()
+                    files[entry.name] = (entry.path, (st.st_mtime_ns, st.st_size))
+        return files
+
+    async def sync(self, agent: SwarmKit):
+        files = await asyncio.to_thread(self._scan)
+        # Forget files removed from input/, so they are sent again if put back
+        for name in self._uploaded.keys() - files.keys():
+            del self._uploaded[name]
+        if not files:
+            return
+
+        # A recreated sandbox (timeout, kill) has none of the files uploaded before
+        if self._uploaded and await agent.get_session() != self._session:
+            self.invalidate()
+
+        changed = {name: entry for name, entry in files.items() if self._uploaded.get(name) != entry[1]}
+        if not changed:
+            return
+
+        # Read changed files concurrently, off the event loop
+        blobs = await asyncio.gather(*(asyncio.to_thread(Path(path).read_bytes) for path, _ in changed.values()))
+        await agent.upload_context(dict(zip(changed, blobs)))
+        for name, (_, identity) in changed.items():
+            self._uploaded[name] = identity
+        # Uploading may have started the sandbox
+        self._session = await agent.get_session()
+
+async def read_prompt(prompt: str) -> str:
+    """console.input() on a daemon thread, so the event loop keeps running while the user types."""
+    # Not asyncio.to_thread: a default-executor thread stuck in input() would block exit on Ctrl+C
+    loop = asyncio.get_running_loop()
+    answer = loop.create_future()
+
+    def settle(setter, value):
+        if not answer.done():
+            setter(value)
+
+    def read():
+        try:
+            line = console.input(prompt)
+        except BaseException as exc:
+            loop.call_soon_threadsafe(settle, answer.set_exception, exc)
+        else:
+            loop.call_soon_threadsafe(settle, answer.set_result, line)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await answer
+
+def write_output_file(path: str, content):
+    if isinstance(content, bytes):
+        Path(path).write_bytes(content)
+    else:
+        # The writer encodes to UTF-8 here on the worker thread; newline="" keeps line endings as-is
+        with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as out:
+            out.write(content)
+
+async def save_output_file(f) -> str:
+    """Write a downloaded output file off the event loop."""
+    path = f"output/{f.name}"
+    await asyncio.to_thread(write_output_file, path, f.content)
+    return path
+
+ARCHIVE_THRESHOLD = 32                          # more output files than this are saved as one .tar
+
+def archive_mtime(modified_time: str, default: float) -> int:
+    """Tar mtime from the SDK's ISO `modified_time`, or `default` if it is missing or malformed."""
+    try:
+        return int(datetime.fromisoformat(modified_time).timestamp())
+    except (TypeError, ValueError):
+        return int(default)
+
+def save_output_archive(files) -> str:
+    """Write many output files as a single tar stream instead of one file each."""
+    now = time.time()
+    path = f"output/{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}.tar"
+    with tarfile.open(path, "w") as tar:
+        for f in files:
+            content = f.content if isinstance(f.content, bytes) else f.content.encode("utf-8")
+            info = tarfile.TarInfo(f.name)
+            info.size = len(content)
+            # Keep the sandbox's modification time when the SDK reports one
+            info.mtime = archive_mtime(f.modified_time, now)
+            tar.addfile(info, io.BytesIO(content))
+    return path
+
 async def main():
     renderer = RichRenderer()
+    inputs = InputSync()
     agent.on("content", renderer.handle_event)
 
     console.print()
@@ -86,32 +205,40 @@ async def main():
     console.print()
 
     while True:
-        prompt = console.input("[bold green]you:[/bold green] ").strip()
+        prompt = (await read_prompt("[bold green]you:[/bold green] ")).strip()
         if not prompt:
             continue
         if prompt in ("/quit", "/exit", "/q"):
             await agent.kill()
             console.print("\n[muted]👋 Goodbye[/muted]")
             break
+        if prompt == "/refresh":
+            inputs.invalidate()
+            console.print("[muted]Input files will be re-uploaded on the next run[/muted]\n")
+            continue
+
+        # Upload new or changed input files to agent's context while the live panel starts
+        upload = asyncio.create_task(inputs.sync(agent))
+        await asyncio.sleep(0)  # sync() scans input/ first; let that start in its thread before the blocking redraw
 
         console.print()
         renderer.reset()
         renderer.start_live()
 
-        # Upload input files to agent's context
-        input_files = {f.name: f.read_bytes() for f in Path("input").iterdir() if f.is_file()}
-        if input_files:
-            await agent.upload_context(input_files)
-
+        await upload
         await agent.run(prompt=prompt)
+        # Fetch output files while the live panel and reasoning are printed
+        fetch_files = asyncio.create_task(agent.get_output_files())
+        await asyncio.sleep(0)  # let the request go out before the blocking redraw
         renderer.stop_live()
 
-        for f in await agent.get_output_files():
-            path = f"output/{f.name}"
-            content = f.content if isinstance(f.content, bytes) else f.content.encode("utf-8")
-            with open(path, "wb") as out:
-                out.write(content)
-            console.print(f"[success]📄 Saved: {path}[/success]")
+        files = await fetch_files
+        if len(files) > ARCHIVE_THRESHOLD:
+            path = await asyncio.to_thread(save_output_archive, files)
+            console.print(f"[success]📦 Saved {len(files)} files: {path}[/success]")
+        else:
+            for path in await asyncio.gather(*(save_output_file(f) for f in files)):
+                console.print(f"[success]📄 Saved: {path}[/success]")
 
         console.print()
 
@@ -122,7 +249,9 @@ async def shutdown():
 if __name__ == "__main__":
     os.makedirs("input", exist_ok=True)
     os.makedirs("output", exist_ok=True)
+    # uvloop.run() passes its loop in directly; the event loop policy API is deprecated
+    run = uvloop.run if uvloop and sys.platform != "win32" else asyncio.run
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
-        asyncio.run(shutdown())
+        run(shutdown())
@@ -1,10 +1,13 @@
 """Rich UI renderer for SwarmKit content events."""
 
+from dataclasses import dataclass
+
 from rich.console import Console, Group
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.spinner import Spinner
+from rich.table import Table
 from rich.text import Text
 from rich.theme import Theme
 
@@ -20,56 +23,148 @@ theme = Theme({
 
 console = Console(theme=theme)
 
+# Map tool kind to display label (like Claude Code)
+KIND_LABELS = {
+    "read": "Read",
+    "edit": "Write",
+    "execute": "Bash",
+    "fetch": "Fetch",
+    "search": "Search",
+    "think": "Task",
+    "switch_mode": "Mode",
+}
+
+# rawInput parameters to show for each kind, most relevant first
+KIND_PARAMS = {
+    "fetch": ("url", "query"),
+    "search": ("query", "pattern", "path", "command"),  # web search or file search
+    "edit": ("file_path", "path"),
+    "read": ("file_path", "absolute_path", "path"),
+    "execute": ("command",),
+}
+DEFAULT_PARAMS = ("command", "query", "file_path", "path", "instruction")
+
+# Tool status -> dot color
+STATUS_STYLES = {
+    "pending": "tool",
+    "in_progress": "tool",
+    "completed": "success",
+    "failed": "error",
+}
+
+PLAN_ICONS = {"completed": "✓", "in_progress": "→", "pending": "○"}
+PLAN_STYLES = {"completed": "success", "in_progress": "info", "pending": "muted"}
+
+# Panel titles, parsed from markup once (Panel copies the Text when rendering)
+PANEL_TITLE = Text.from_markup("[bold cyan]Factotum[/bold cyan]")
+PLAN_TITLE = Text.from_markup("[bold]Plan[/bold]")
+
+
+@dataclass(slots=True)
+class MessageEvent:
+    """A finished agent message, flushed before the next tool call."""
+    text: str
+
+
+@dataclass(slots=True)
+class ToolEvent:
+    """Position of a tool call in the event stream; state lives in RichRenderer.tools."""
+    id: str
+
+
+@dataclass(slots=True)
+class Tool:
+    """Latest known state of a tool call."""
+    title: str = "Tool"
+    kind: str = "other"
+    status: str = "pending"
+    raw_input: dict | None = None
+
+
+class _ToolRow:
+    """Renderable for a tracked tool that always shows its latest status."""
+
+    def __init__(self, renderer, tool_id: str):
+        self.renderer = renderer
+        self.tool_id = tool_id
+
+    def __rich__(self):
+        return self.renderer._render_tool(self.tool_id)
+
 
 class RichRenderer:
     """Renders ACP content events with Rich formatting."""
 
     def __init__(self):
-        self.events = []  # Ordered list: {'type': 'tool'|'message', ...}
-        self.current_message = ""  # Accumulating message chunk
-        self.thought_buffer = ""
+        self.events = []  # Ordered list of MessageEvent | ToolEvent
+        self._message_chunks = []  # Accumulating message, joined on read
+        self._thought_chunks = []
+        self._message_has_content = False  # Any non-whitespace chunk so far
+        self._thought_has_content = False
         self.plan_entries = []
-        self.tools = {}  # id -> {title, status} for updates
+        self.tools = {}  # id -> Tool for updates
         self.live = None
         self.working = False
+        self._spinner_row = None  # Built in start_live
+        self._rendered = []  # Renderables for self.events[:self._rendered_upto]
+        self._rendered_upto = 0
+        self._rendered_type = None  # Class of the last rendered event
+        self._current_md = None  # (chunk list, chunk count, Markdown) of current_message
+        self._tool_text_cache = {}  # id -> (Tool, status, Text) last rendered
+        # sessionUpdate -> handler; user_message_chunk is skipped - inconsistent across agents
+        self._handlers = {
+            "agent_message_chunk": self._handle_message,
+            "agent_thought_chunk": self._handle_thought,
+            "tool_call": self._handle_tool_call,
+            "tool_call_update": self._handle_tool_update,
+            "plan": self._handle_plan,
+        }
 
     def reset(self):
         self.events = []
-        self.current_message = ""
-        self.thought_buffer = ""
+        self._tool_text_cache = {}
+        self._rendered = []
+        self._rendered_upto = 0
+        self._rendered_type = None
+        self._current_md = None
+        self._message_chunks = []
+        self._thought_chunks = []
+        self._message_has_content = False
+        self._thought_has_content = False
         self.plan_entries = []
         self.tools = {}
         self.working = False
 
+    @property
+    def current_message(self) -> str:
+        return "".join(self._message_chunks)
+
+    @property
+    def thought_buffer(self) -> str:
+        return "".join(self._thought_chunks)
+
     def handle_event(self, event: dict):
-        """Handle a content event and render it."""
+        """Apply a content event to the render state; Live picks it up on its next refresh."""
         update = event.get("update", {})
-        event_type = update.get("sessionUpdate")
-
-        if event_type == "agent_message_chunk":
-            self._handle_message(update)
-        elif event_type == "agent_thought_chunk":
-            self._handle_thought(update)
-        elif event_type == "tool_call":
-            self._handle_tool_call(update)
-        elif event_type == "tool_call_update":
-            self._handle_tool_update(update)
-        elif event_type == "plan":
-            self._handle_plan(update)
-        # Skip user_message_chunk - inconsistent across agents
+        handler = self._handlers.get(update.get("sessionUpdate"))
+        if handler:
+            handler(update)
 
     def _handle_message(self, update: dict):
         content = update.get("content", {})
         if content.get("type") == "text":
             text = content.get("text", "")
-            self.current_message += text
-            self._refresh()
+            self._message_chunks.append(text)
+            if not self._message_has_content and text.strip():
+                self._message_has_content = True
 
     def _handle_thought(self, update: dict):
         content = update.get("content", {})
         if content.get("type") == "text":
             text = content.get("text", "")
-            self.thought_buffer += text
+            self._thought_chunks.append(text)
+            if not self._thought_has_content and text.strip():
+                self._thought_has_content = True
 
     def _handle_tool_call(self, update: dict):
         tool_id = update.get("toolCallId", "")
@@ -79,90 +174,64 @@ class RichRenderer:
         raw_input = update.get("rawInput", {})
 
         # Flush current message if any (to maintain order)
-        if self.current_message.strip():
-            self.events.append({'type': 'message', 'text': self.current_message})
-            self.current_message = ""
+        # Clear the streaming state before appending, so a concurrent render never shows both
+        if self._message_has_content:
+            message = self.current_message
+            self._message_chunks = []
+            self._message_has_content = False
+            self._current_md = None
+            self.events.append(MessageEvent(message))
 
         # Track tool
-        self.tools[tool_id] = {'title': title, 'kind': kind, 'status': status, 'raw_input': raw_input}
-        self.events.append({'type': 'tool', 'id': tool_id})
-        self._refresh()
+        self.tools[tool_id] = Tool(title, kind, status, raw_input)
+        self._tool_text_cache.pop(tool_id, None)  # A repeated tool_call may change title/rawInput
+        self.events.append(ToolEvent(tool_id))
 
     def _handle_tool_update(self, update: dict):
         tool_id = update.get("toolCallId", "")
-        status = update.get("status", "")
+        status = update.get("status")
 
-        if tool_id in self.tools:
-            self.tools[tool_id]['status'] = status
-            self._refresh()
+        # Updates often carry only content; those leave the row (and its cached Text) alone
+        tool = self.tools.get(tool_id)
+        if tool and status and tool.status != status:
+            tool.status = status
+            self._tool_text_cache.pop(tool_id, None)
 
     def _handle_plan(self, update: dict):
         self.plan_entries = update.get("entries", [])
-        self._refresh()
-
-    def _refresh(self):
-        if self.live:
-            self.live.update(self._render())
 
     def _render_tool(self, tool_id: str) -> Text:
         """Render a single tool status with kind-based label."""
-        tool = self.tools.get(tool_id, {})
-        title = tool.get('title', 'Tool')
-        kind = tool.get('kind', 'other')
-        status = tool.get('status', 'pending')
-        raw_input = tool.get('raw_input', {}) or {}
+        tool = self.tools.get(tool_id) or Tool()
+        title = tool.title
+        kind = tool.kind
+        status = tool.status
+        raw_input = tool.raw_input or {}
+
+        # Reuse the last row while it is for this Tool and status. Keying on the Tool
+        # object matters: a render on Live's thread can store a row for a Tool that a
+        # repeated tool_call has just replaced
+        cached = self._tool_text_cache.get(tool_id)
+        if cached and cached[0] is tool and cached[1] == status:
+            return cached[2]
 
         # Skip displaying todo/plan tools (plan is shown separately)
         if title in ("write_todos", "TodoWrite") or "todo" in title.lower():
             return None
 
-        # Map kind to display label (like Claude Code)
-        kind_labels = {
-            "read": "Read",
-            "edit": "Write",
-            "execute": "Bash",
-            "fetch": "Fetch",
-            "search": "Search",
-            "think": "Task",
-            "switch_mode": "Mode",
-        }
-
-        # Extract meaningful content from rawInput based on kind
-        def get_content():
-            # Try to get the most relevant parameter
-            if kind == "fetch":
-                return raw_input.get("url") or raw_input.get("query") or title
-            elif kind == "search":
-                # Web search (query) or file search (pattern/path)
-                return raw_input.get("query") or raw_input.get("pattern") or raw_input.get("path") or raw_input.get("command") or title
-            elif kind == "edit":
-                return raw_input.get("file_path") or raw_input.get("path") or title
-            elif kind == "read":
-                return raw_input.get("file_path") or raw_input.get("absolute_path") or raw_input.get("path") or title
-            elif kind == "execute":
-                return raw_input.get("command") or title
-            else:
-                # For unknown kinds, try common parameter names
-                return (raw_input.get("command") or raw_input.get("query") or
-                        raw_input.get("file_path") or raw_input.get("path") or
-                        raw_input.get("instruction") or title)
-
-        # Determine dot color based on status
-        if status in ('pending', 'in_progress'):
-            dot_style = "tool"
-        elif status == 'completed':
-            dot_style = "success"
-        elif status == 'failed':
-            dot_style = "error"
-        else:
-            dot_style = "muted"
+        dot_style = STATUS_STYLES.get(status, "muted")
 
         # Build styled text: colored dot, white label and content
         result = Text()
         result.append("● ", style=dot_style)
 
-        label = kind_labels.get(kind)
-        content = get_content()
+        label = KIND_LABELS.get(kind)
+        # Most relevant parameter from rawInput for this kind, else the title
+        content = title
+        for name in KIND_PARAMS.get(kind, DEFAULT_PARAMS):
+            if raw_input.get(name):
+                content = raw_input[name]
+                break
 
         # Strip backticks - not needed with Type() format
         if isinstance(content, str):
@@ -181,6 +250,7 @@ class RichRenderer:
             result.append(str(content), style="dim white")
             result.append(")", style="white")
 
+        self._tool_text_cache[tool_id] = (tool, status, result)
         return result
 
     def _render_plan(self) -> Panel:
@@ -192,22 +262,46 @@ class RichRenderer:
         for entry in self.plan_entries:
             status = entry.get("status", "pending")
             content = entry.get("content", "")
-            icon = {"completed": "✓", "in_progress": "→", "pending": "○"}.get(status, "○")
-            style = {"completed": "success", "in_progress": "info", "pending": "muted"}.get(status, "muted")
+            icon = PLAN_ICONS.get(status, "○")
+            style = PLAN_STYLES.get(status, "muted")
             lines.append(f"[{style}]{icon} {content}[/{style}]")
 
-        return Panel("\n".join(lines), title="[bold]Plan[/bold]", border_style="cyan", padding=(0, 1))
+        return Panel("\n".join(lines), title=PLAN_TITLE, border_style="cyan", padding=(0, 1))
+
+    def _commit_events(self):
+        """Convert events added since the last render; earlier ones are kept as-is."""
+        # Each tool on its own line, with spacing between sections
+        for event in self.events[self._rendered_upto:]:
+            # Add spacing when switching between tools and messages
+            if self._rendered_type and self._rendered_type is not type(event):
+                self._rendered.append(Text())
+
+            if isinstance(event, MessageEvent):
+                self._rendered.append(Markdown(event.text))
+            elif self._render_tool(event.id):  # Skip None (e.g., todo tools)
+                self._rendered.append(_ToolRow(self, event.id))
+
+            self._rendered_type = type(event)
+            self._rendered_upto += 1
+
+    def _current_markdown(self) -> Markdown:
+        """Re-parse the streaming message only when new chunks have arrived."""
+        # Runs on Live's refresh thread: work from one snapshot of the chunk list, and key
+        # on the list itself since a flush swaps in a new one that may reach the same count
+        chunks = self._message_chunks
+        count = len(chunks)
+        cached = self._current_md
+        if cached is None or cached[0] is not chunks or cached[1] != count:
+            cached = self._current_md = (chunks, count, Markdown("".join(chunks[:count])))
+        return cached[2]
 
     def _render(self):
         """Render current state for live display."""
         elements = []
 
         # Working spinner at top
-        if self.working:
-            from rich.table import Table
-            spinner_row = Table.grid(padding=(0, 1))
-            spinner_row.add_row(Spinner("dots", style="cyan"), Text("Working...", style="bold cyan"))
-            elements.append(spinner_row)
+        if self.working and self._spinner_row:
+            elements.append(self._spinner_row)
             elements.append(Text())
 
         # Plan at top if exists
@@ -216,29 +310,16 @@ class RichRenderer:
             elements.append(plan)
             elements.append(Text())
 
-        # Render events in order (interleaved tools and messages)
-        # Each tool on its own line, with spacing between sections
-        prev_type = None
-        for event in self.events:
-            # Add spacing when switching between tools and messages
-            if prev_type and prev_type != event['type']:
-                elements.append(Text())
-
-            if event['type'] == 'message':
-                elements.append(Markdown(event['text']))
-            elif event['type'] == 'tool':
-                tool_element = self._render_tool(event['id'])
-                if tool_element:  # Skip None (e.g., todo tools)
-                    elements.append(tool_element)
-
-            prev_type = event['type']
+        # Events rendered so far, in order (interleaved tools and messages)
+        self._commit_events()
+        elements.extend(self._rendered)
 
         # Current streaming message
-        if self.current_message.strip():
+        if self._message_has_content:
             # Add spacing if previous was a tool
-            if prev_type == 'tool':
+            if self._rendered_type is ToolEvent:
                 elements.append(Text())
-            elements.append(Markdown(self.current_message))
+            elements.append(self._current_markdown())
 
         # If nothing yet, show working spinner only
         if not elements:
@@ -246,7 +327,7 @@ class RichRenderer:
 
         # Wrap everything in panel
         content = Group(*elements) if len(elements) > 1 else elements[0]
-        return Panel(content, title="[bold cyan]Factotum[/bold cyan]", border_style="cyan", padding=(1, 2))
+        return Panel(content, title=PANEL_TITLE, border_style="cyan", padding=(1, 2))
 
     def __rich__(self):
         """Make renderer itself a renderable for Live auto-refresh."""
@@ -254,19 +335,22 @@ class RichRenderer:
 
     def start_live(self):
         self.working = True
+        # Built once per run; the Spinner advances its own frame on each render
+        self._spinner_row = Table.grid(padding=(0, 1))
+        self._spinner_row.add_row(Spinner("dots", style="cyan"), Text("Working...", style="bold cyan"))
+        # Live pulls __rich__ on its own refresh tick, so handlers only update state
         self.live = Live(self, console=console, refresh_per_second=10, transient=False)
         self.live.start()
 
     def stop_live(self):
         self.working = False
         if self.live:
-            # Final render with "Factotum" title (not working)
-            self.live.update(self._render())
+            # stop() does the final render, now without the spinner
             self.live.stop()
             self.live = None
 
         # Show reasoning if any (after main panel)
-        if self.thought_buffer.strip():
+        if self._thought_has_content:
             console.print()
             console.print(Panel(
                 Text(self.thought_buffer, style="thought"),